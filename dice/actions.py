@@ -33,6 +33,7 @@ from dicedb.query import LIMIT_REROLLS
 CHECK_TIMER_GAP = 5
 TIMERS = {}
 TIMER_OFFSETS = ["60:00", "15:00", "5:00", "1:00"]
+IS_TIMER_SPEC = re.compile(r'[0-9:]+')
 PF2_URL = 'https://pf2.d20pfsrd.com/?s={}'
 PF_URL = 'https://cse.google.com/cse?cx=006680642033474972217%3A6zo0hx_wle8&q={}'
 D5_URL = 'https://cse.google.com/cse?cx=006680642033474972217%3A1xq0zf2wtvq&q={}'
@@ -320,7 +321,7 @@ class Timer(dice.util.ReprMixin, Action):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-        if not re.match(r'[0-9:]+', self.args.time) or self.args.time.count(':') > 2:
+        if not IS_TIMER_SPEC.match(self.args.time) or self.args.time.count(':') > 2:
             raise dice.exc.InvalidCommandArgs("I can't understand time spec! Use format: **HH:MM:SS**")
 
         self.last_msgs = []
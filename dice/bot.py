@@ -89,7 +89,6 @@ class DiceBot(discord.Client):
         super().__init__(**kwargs)
         self.prefix = prefix
         self.emoji = EmojiResolver()
-        self.parser = dice.parse.make_parser(prefix)
         self.start_date = datetime.datetime.utcnow().replace(microsecond=0)
         self.player = None
 
@@ -123,6 +122,15 @@ class DiceBot(discord.Client):
         """
         return discord.utils.get(self.get_all_channels(), name=name)
 
+    def parse_args(self, argv):
+        """
+        Parse argv with a parser that only builds the subcommand argv invokes.
+        Parsers are built on first use of a subcommand and cached after, as are repeated commands.
+
+        Returns: The argparse.Namespace of parsed arguments.
+        """
+        return dice.parse.parse_args(self.prefix, argv)
+
     # Events hooked by bot.
     async def on_member_join(self, member):
         """ Called when member joins guild (login). """
@@ -182,7 +190,8 @@ class DiceBot(discord.Client):
 
         try:
             content = re.sub(r'<[#@]\S+>', '', content).strip()  # Strip mentions from text
-            args = self.parser.parse_args(re.split(r'\s+', content))
+            argv = re.split(r'\s+', content)
+            args = dice.parse.fast_parse(self.prefix, argv) or self.parse_args(argv)
             await self.dispatch_command(args=args, bot=self, msg=message)
 
         except dice.exc.ArgumentParseError as exc:
@@ -190,7 +199,7 @@ class DiceBot(discord.Client):
             dice.exc.write_log(exc, log, content=content, author=author, channel=channel)
             if 'invalid choice' not in str(exc):
                 try:
-                    self.parser.parse_args(content.split(' ')[0:1] + ['--help'])
+                    self.parse_args(content.split(' ')[0:1] + ['--help'])
                 except dice.exc.ArgumentHelpError as exc2:
                     args = list(exc.args)
                     args += ['Invalid command use. Check the command help.']
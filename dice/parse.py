@@ -7,17 +7,62 @@ what action to be invoked.
 from __future__ import absolute_import, print_function
 
 import argparse
+import functools
+import sys
 from argparse import RawDescriptionHelpFormatter as RawHelp
 
 import dice.exc
 
-PARSERS = []
+PARSERS = {}
+# Aliases of subcommands, mapped to the name the subcommand is registered under
+ALIASES = {
+    'm': 'math',
+    'r': 'roll',
+}
+
+
+def fresh_formatter(func):
+    """
+    Decorate ThrowArggumentParser methods that render text with the formatter.
+    The cached formatter is dropped before and after so rendered text never accumulates.
+    """
+    @functools.wraps(func)
+    def inner(self, *args, **kwargs):
+        self._cached_formatter = None  # pylint: disable=protected-access
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            self._cached_formatter = None  # pylint: disable=protected-access
+
+    return inner
 
 
 class ThrowArggumentParser(argparse.ArgumentParser):
     """
     ArgumentParser subclass that does NOT terminate the program.
+
+    A single formatter is reused for validation, argparse requests one or more per add_argument.
     """
+    def __init__(self, *args, **kwargs):
+        # Set before super().__init__, adding the help argument already requests a formatter
+        self._cached_formatter = None
+        # Help is raised as text for discord, never written to a terminal.
+        # Disabling color also skips the terminal probing done per formatter on 3.14+.
+        if sys.version_info >= (3, 14):
+            kwargs.setdefault('color', False)
+        super().__init__(*args, **kwargs)
+
+    add_subparsers = fresh_formatter(argparse.ArgumentParser.add_subparsers)
+    format_usage = fresh_formatter(argparse.ArgumentParser.format_usage)
+    format_help = fresh_formatter(argparse.ArgumentParser.format_help)
+
+    def _get_formatter(self):
+        if self._cached_formatter is None:
+            self._cached_formatter = super()._get_formatter()
+
+        return self._cached_formatter
+
+    @fresh_formatter
     def print_help(self, file=None):  # pylint: disable=redefined-builtin
         formatter = self._get_formatter()
         formatter.add_text(self.description)
@@ -30,68 +75,243 @@ class ThrowArggumentParser(argparse.ArgumentParser):
         """
         Suppress default exit behaviour.
         """
-        raise dice.exc.ArgumentParseError(message)
+        raise dice.exc.ArgumentParseError(message or '')
 
 
-def make_parser(prefix):
+def make_parser(prefix, argv=None):
     """
     Returns the bot parser.
+
+    When argv is provided and the subcommand it invokes is known, only that
+    subcommand and help are added to the parser. Otherwise all subcommands are added.
+
+    Parsers are cached and shared between callers, do not modify the returned parser.
+
+    Args:
+        prefix: The prefix that starts every command.
+        argv: Optional, the list of tokens the parser will be used on.
+    """
+    return build_parser(prefix, sniff_subcommand(prefix, argv))
+
+
+@functools.lru_cache(maxsize=32)
+def build_parser(prefix, name=None):
+    """
+    Build the parser for prefix, results are cached.
+    Use build_parser.__wrapped__ to get a fresh parser.
+
+    Args:
+        prefix: The prefix that starts every command.
+        name: When set, only add this subcommand and help. Otherwise add all subcommands.
     """
     parser = ThrowArggumentParser(prog='', description='simple discord bot')
 
     subs = parser.add_subparsers(title='subcommands',
                                  description='The subcommands of dice')
 
-    for func in PARSERS:
-        func(subs, prefix)
+    for key, func in PARSERS.items():
+        if not name or key in ('help', name):
+            func(subs, prefix)
 
     return parser
 
 
-def register_parser(func):
-    """ Simple registration function, use as decorator. """
-    PARSERS.append(func)
-    return func
+def parse_args(prefix, argv):
+    """
+    Parse argv with the parser from make_parser, repeated commands are served from a cache.
 
+    Args:
+        prefix: The prefix that starts every command.
+        argv: The list of tokens to parse.
 
-@register_parser
-def subs_help(subs, prefix):
-    """ Subcommand parsing for help """
-    sub = subs.add_parser(prefix + 'help', description='Show overall help message.')
-    sub.set_defaults(cmd='Help')
+    Raises:
+        ArgumentParseError: Failed to parse argv.
+        ArgumentHelpError: Help was requested.
 
+    Returns:
+        A new argparse.Namespace, the caller may modify it freely.
+    """
+    cached = cached_parse_args(prefix, tuple(argv))
+    return argparse.Namespace(**{key: list(val) if isinstance(val, list) else val
+                                 for key, val in vars(cached).items()})
 
-@register_parser
-def subs_m(subs, prefix):
-    """ Subcommand parsing for math """
-    desc = f"""Evaluate some simple math operations.
 
-{prefix}m 1 + 2
-        Do simple math operations.
-{prefix}m 1 + 2, 55/5, 5 * 10
-        Do several math operations.
+@functools.lru_cache(maxsize=256)
+def cached_parse_args(prefix, argv):
     """
-    sub = subs.add_parser(prefix + 'm', description=desc, formatter_class=RawHelp)
-    sub.set_defaults(cmd='Math')
-    sub.add_argument('spec', nargs='+', help='The math operations.')
+    Cached parse of the argv tuple. The Namespace returned is shared, use parse_args instead.
+    """
+    argv = list(argv)
+    return make_parser(prefix, argv).parse_args(argv)
 
 
-@register_parser
-def subs_math(subs, prefix):
-    """ Subcommand parsing for math """
-    desc = f"""Evaluate some simple math operations.
+def sniff_subcommand(prefix, argv):
+    """
+    Determine the subcommand argv invokes without parsing it.
+    Like argparse, only the first token can select the subcommand.
+
+    Args:
+        prefix: The prefix that starts every command.
+        argv: The list of tokens to be parsed, may be None.
+
+    Returns:
+        The key in PARSERS of the subcommand. None if it could not be determined.
+    """
+    if not argv or not argv[0].startswith(prefix):
+        return None
+
+    name = argv[0][len(prefix):]
+    name = ALIASES.get(name, name)
+    return name if name in PARSERS else None
+
+
+def aliases_for(prefix, name):
+    """
+    Returns the prefixed aliases of the subcommand registered under name, see ALIASES.
+    """
+    return [prefix + alias for alias, target in ALIASES.items() if target == name]
+
+
+def fast_parse(prefix, argv):
+    """
+    Parse the simplest forms of the most common commands without argparse.
+
+    Args:
+        prefix: The prefix that starts every command.
+        argv: The list of tokens to parse.
+
+    Returns:
+        The argparse.Namespace the full parser would return.
+        None if argv must be parsed by the full parser.
+    """
+    if not argv or not argv[0].startswith(prefix):
+        return None
+
+    name = argv[0][len(prefix):]
+    func = FAST_PATHS.get(ALIASES.get(name, name))
+    return func(argv[1:]) if func else None
+
+
+def fast_parse_no_args(cmd, argv, **defaults):
+    """ Fast path for commands invoked without arguments, defaults are the parser's defaults. """
+    return None if argv else argparse.Namespace(cmd=cmd, **defaults)
+
+
+def fast_parse_terms(cmd, dest, argv):
+    """ Fast path for commands taking one or more positional terms, only when no flags. """
+    if not argv or any(token.startswith('-') and token != '-' for token in argv):
+        return None
+
+    return argparse.Namespace(cmd=cmd, **{dest: argv})
+
+
+def fast_parse_n(argv):
+    """ Fast path for n, only an optional integer number of steps. """
+    if len(argv) > 1:
+        return None
+
+    try:
+        steps = int(argv[0]) if argv else 1
+    except ValueError:
+        return None
+
+    return argparse.Namespace(cmd='Turn', subcmd='next', steps=steps)
+
+
+def fast_parse_roll(argv):
+    """ Fast path for roll, only dice specs with no flags. """
+    if any(token.startswith('-') and token != '-' for token in argv):
+        return None
+
+    return argparse.Namespace(cmd='Roll', spec=argv, list=False, remove=None, save=None)
+
+
+FAST_PATHS = {
+    'help': functools.partial(fast_parse_no_args, 'Help'),
+    'math': functools.partial(fast_parse_terms, 'Math', 'spec'),
+    'n': fast_parse_n,
+    'o.o': functools.partial(fast_parse_no_args, 'Googly', set=None, used=None, offset=None),
+    'poni': functools.partial(fast_parse_terms, 'Poni', 'tags'),
+    'pun': functools.partial(fast_parse_no_args, 'Pun', add=None, manage=False),
+    'reroll': functools.partial(fast_parse_no_args, 'Reroll', menu=False, offset=-1),
+    'roll': fast_parse_roll,
+    'status': functools.partial(fast_parse_no_args, 'Status'),
+    'timers': functools.partial(fast_parse_no_args, 'Timers', clear=False, manage=False),
+}
+
+
+def format_desc(template, prefix):
+    """
+    Format a subcommand description template for prefix.
+
+    Args:
+        template: The description with {prefix} placeholders.
+        prefix: The prefix that starts every command.
+    """
+    return template.replace('{prefix}', prefix)
+
+
+def register_parser(name=None):
+    """
+    Simple registration function, use as decorator: @register_parser() or @register_parser(name='d5')
+    The subcommand is registered under name, by default the function name minus the 'subs_' prefix.
+    Registering the same function again is a no-op.
+
+    Raises:
+        ValueError: A different function is already registered under name.
+    """
+    def inner(func):
+        key = name or func.__name__[len('subs_'):]
+        if PARSERS.setdefault(key, func) is not func:
+            raise ValueError(f"A parser is already registered for subcommand: {key}")
+
+        return func
+
+    return inner
+
+
+def static_parser(name, cmd, description):
+    """
+    Make and register the subcommand parsing function for a command that takes no arguments.
+
+    Args:
+        name: The name of the subcommand, without prefix.
+        cmd: The name of the action class to dispatch to.
+        description: The description shown in help.
+    """
+    def subs_static(subs, prefix):
+        sub = subs.add_parser(prefix + name, description=description)
+        sub.set_defaults(cmd=cmd)
+
+    subs_static.__name__ = subs_static.__qualname__ = 'subs_' + name
+    return register_parser()(subs_static)
+
+
+subs_help = static_parser('help', 'Help', 'Show overall help message.')
+
+
+DESC_MATH = """Evaluate some simple math operations.
+
+{prefix}m is aliased to this command.
 
 {prefix}math 1 + 2
         Do simple math operations.
 {prefix}math 1 + 2, 55/5, 5 * 10
         Do several math operations.
     """
-    sub = subs.add_parser(prefix + 'math', description=desc, formatter_class=RawHelp)
+
+
+@register_parser()
+def subs_math(subs, prefix):
+    """ Subcommand parsing for math """
+    desc = format_desc(DESC_MATH, prefix)
+    sub = subs.add_parser(prefix + 'math', aliases=aliases_for(prefix, 'math'),
+                          description=desc, formatter_class=RawHelp)
     sub.set_defaults(cmd='Math')
     sub.add_argument('spec', nargs='+', help='The math operations.')
 
 
-#  @register_parser
+#  @register_parser()
 #  def subs_music(subs, prefix):
     #  """ Subcommand parsing for music """
     #  desc = """A simple music player for users to stream yt or local media.
@@ -157,10 +377,7 @@ def subs_math(subs, prefix):
     #  sub3.add_argument('volume', type=int, help='Set the volume: [0, 100]')
 
 
-@register_parser
-def subs_roll(subs, prefix):
-    """ Subcommand parsing for roll """
-    desc = f"""Evaluate some simple math operations.
+DESC_ROLL = """Evaluate some simple math operations.
 
 Many modifiers support predicates to trigger,
 these include (r)eroll, (!)explosive dice, (!!)compounding dice and (f)ail and success declarations.
@@ -217,7 +434,14 @@ these include (r)eroll, (!)explosive dice, (!!)compounding dice and (f)ail and s
 {prefix}roll 4d6 @user1 @user2
         Roll 4d6, only you, user1 and user2 will see the result in direct DMs by bot.
     """
-    sub = subs.add_parser(prefix + 'roll', aliases=[prefix + 'r'], description=desc, formatter_class=RawHelp)
+
+
+@register_parser()
+def subs_roll(subs, prefix):
+    """ Subcommand parsing for roll """
+    desc = format_desc(DESC_ROLL, prefix)
+    sub = subs.add_parser(prefix + 'roll', aliases=aliases_for(prefix, 'roll'),
+                          description=desc, formatter_class=RawHelp)
     sub.set_defaults(cmd='Roll')
     sub.add_argument('spec', nargs='*', help='The dice rolls specified.')
     sub.add_argument('-l', '--list', action='store_true', help='List all saved rolls.')
@@ -225,84 +449,109 @@ these include (r)eroll, (!)explosive dice, (!!)compounding dice and (f)ail and s
     sub.add_argument('-s', '--save', help='Save roll with this name.')
 
 
-@register_parser
-def subs_pf(subs, prefix):
-    """ Subcommand parsing for searching pathfinder wiki """
-    desc = f"""Search something on Pathfinder Wiki.
+@functools.lru_cache(maxsize=None)
+def wiki_parent():
+    """
+    Parent parser with the arguments shared by all wiki search subcommands.
+    Built once, the subcommands reuse its actions instead of adding their own.
+    """
+    parent = ThrowArggumentParser(add_help=False)
+    parent.add_argument('-n', '--num', type=int, default=5, help='Number of results.')
+    parent.add_argument('terms', nargs='+', help='To search.')
+
+    return parent
+
+
+DESC_PF = """Search something on Pathfinder Wiki.
 
 {prefix}pf arcane mark
         Search for "arcane mark" and return first 3 matches.
 {prefix}pf --num 5 arcane mark
         Search for "arcane mark" and return first 5 matches.
     """
-    sub = subs.add_parser(prefix + 'pf', description=desc, formatter_class=RawHelp)
-    sub.set_defaults(cmd='SearchWiki', url='PF_URL', wiki='Pathfinder Wiki')
-    sub.add_argument('-n', '--num', type=int, default=5, help='Number of results.')
-    sub.add_argument('terms', nargs='+', help='To search.')
 
 
-@register_parser
-def subs_pf2(subs, prefix):
+@register_parser()
+def subs_pf(subs, prefix):
     """ Subcommand parsing for searching pathfinder wiki """
-    desc = f"""Search something on Pathfinder 2e Wiki.
+    desc = format_desc(DESC_PF, prefix)
+    sub = subs.add_parser(prefix + 'pf', description=desc, formatter_class=RawHelp,
+                          parents=[wiki_parent()])
+    sub.set_defaults(cmd='SearchWiki', url='PF_URL', wiki='Pathfinder Wiki')
+
+
+DESC_PF2 = """Search something on Pathfinder 2e Wiki.
 
 {prefix}pf2 arcane mark
         Search for "arcane mark" and return first 3 matches.
 {prefix}pf2 --num 5 arcane mark
         Search for "arcane mark" and return first 5 matches.
     """
-    sub = subs.add_parser(prefix + 'pf2', description=desc, formatter_class=RawHelp)
+
+
+@register_parser()
+def subs_pf2(subs, prefix):
+    """ Subcommand parsing for searching pathfinder wiki """
+    desc = format_desc(DESC_PF2, prefix)
+    sub = subs.add_parser(prefix + 'pf2', description=desc, formatter_class=RawHelp,
+                          parents=[wiki_parent()])
     sub.set_defaults(cmd='PF2Wiki', url='PF2_URL', wiki='Pathfinder 2e Wiki')
-    sub.add_argument('-n', '--num', type=int, default=5, help='Number of results.')
-    sub.add_argument('terms', nargs='+', help='To search.')
 
 
-@register_parser
-def subs_d5e(subs, prefix):
-    """ Subcommand parsing for searching d&d5 wiki """
-    desc = f"""Search something on D&D 5e Wiki.
+DESC_D5E = """Search something on D&D 5e Wiki.
 
 {prefix}d5 arcane mark
         Search for "arcane mark" and return first 3 matches.
 {prefix}d5 --num 5 arcane mark
         Search for "arcane mark" and return first 5 matches.
     """
-    sub = subs.add_parser(prefix + 'd5', description=desc, formatter_class=RawHelp)
+
+
+@register_parser(name='d5')
+def subs_d5e(subs, prefix):
+    """ Subcommand parsing for searching d&d5 wiki """
+    desc = format_desc(DESC_D5E, prefix)
+    sub = subs.add_parser(prefix + 'd5', description=desc, formatter_class=RawHelp,
+                          parents=[wiki_parent()])
     sub.set_defaults(cmd='SearchWiki', url='D5_URL', wiki='D&D 5e Wiki')
-    sub.add_argument('-n', '--num', type=int, default=5, help='Number of results.')
-    sub.add_argument('terms', nargs='+', help='To search.')
 
 
-@register_parser
-def subs_star(subs, prefix):
-    """ Subcommand parsing for searching starfinder wiki """
-    desc = f"""Search something on Starfinder Wiki.
+
+DESC_STAR = """Search something on Starfinder Wiki.
 
 {prefix}pf arcane mark
         Search for "arcane mark" and return first 3 matches.
 {prefix}pf --num 5 arcane mark
         Search for "arcane mark" and return first 5 matches.
     """
-    sub = subs.add_parser(prefix + 'star', description=desc, formatter_class=RawHelp)
+
+
+@register_parser()
+def subs_star(subs, prefix):
+    """ Subcommand parsing for searching starfinder wiki """
+    desc = format_desc(DESC_STAR, prefix)
+    sub = subs.add_parser(prefix + 'star', description=desc, formatter_class=RawHelp,
+                          parents=[wiki_parent()])
     sub.set_defaults(cmd='SearchWiki', url='STAR_URL', wiki='Starfinder Wiki')
-    sub.add_argument('-n', '--num', type=int, default=5, help='Number of results.')
-    sub.add_argument('terms', nargs='+', help='To search.')
 
 
-@register_parser
-def subs_poni(subs, prefix):
-    """ Subcommand parsing for poni """
-    desc = f"""Be magical!
+DESC_PONI = """Be magical!
 
 {prefix}poni tag_1, tag 2, tag of words
         Do something poniful!
     """
+
+
+@register_parser()
+def subs_poni(subs, prefix):
+    """ Subcommand parsing for poni """
+    desc = format_desc(DESC_PONI, prefix)
     sub = subs.add_parser(prefix + 'poni', description=desc, formatter_class=RawHelp)
     sub.set_defaults(cmd='Poni')
     sub.add_argument('tags', nargs='+', help='To search.')
 
 
-#  @register_parser
+#  @register_parser()
 #  def subs_songs(subs, prefix):
     #  """ Subcommand parsing for songs """
     #  desc = """Manage the song lookup.
@@ -338,17 +587,10 @@ def subs_poni(subs, prefix):
     #  sub.add_argument('-t', '--tag', nargs='+', help='Search the song names.')
 
 
-@register_parser
-def subs_status(subs, prefix):
-    """ Subcommand parsing for status """
-    sub = subs.add_parser(prefix + 'status', description='Info about this bot.')
-    sub.set_defaults(cmd='Status')
+subs_status = static_parser('status', 'Status', 'Info about this bot.')
 
 
-@register_parser
-def subs_turn(subs, prefix):
-    """ Subcommand parsing for turn """
-    desc = f"""Manage the turn order.
+DESC_TURN = """Manage the turn order.
 
 {prefix}turn
         Show the complete current turn order.
@@ -363,40 +605,69 @@ def subs_turn(subs, prefix):
 {prefix}turn update Chris/1, Noggles/22, ...
         Override the rolls for init for matching characters.
     """
+
+
+@functools.lru_cache(maxsize=None)
+def turn_chars_parent(verb):
+    """
+    Parent parser with the characters argument of the turn subcommands.
+    Built once per verb, the verb only changes the help text.
+    """
+    parent = ThrowArggumentParser(add_help=False)
+    parent.add_argument('chars', nargs='+', help=f'The characters to {verb}.')
+
+    return parent
+
+
+@functools.lru_cache(maxsize=None)
+def turn_steps_parent():
+    """
+    Parent parser with the steps argument shared by the turn next and n subcommands.
+    """
+    parent = ThrowArggumentParser(add_help=False)
+    parent.add_argument('steps', nargs='?', type=int, default=1, help='Positive or negative steps of turns.')
+
+    return parent
+
+
+@register_parser()
+def subs_turn(subs, prefix):
+    """ Subcommand parsing for turn """
+    desc = format_desc(DESC_TURN, prefix)
     sub = subs.add_parser(prefix + 'turn', description=desc, formatter_class=RawHelp)
     sub.set_defaults(cmd='Turn')
 
     subcmds = sub.add_subparsers(title='subcommands',
                                  description='Turn subcommands', dest='subcmd')
-    subcmd = subcmds.add_parser('add', help='Add one or more combat characters.')
-    subcmd.add_argument('chars', nargs='+', help='The characters to add.')
-    subcmd = subcmds.add_parser('clear', help='Clear the combat.')
-    subcmd = subcmds.add_parser('remove', help='Remove one or more combat characters by name.')
-    subcmd.add_argument('chars', nargs='+', help='The characters to remove.')
-    subcmd = subcmds.add_parser('update', help='Update the init rolls for one or more combat characters.')
-    subcmd.add_argument('chars', nargs='+', help='The characters to update.')
-    subcmd = subcmds.add_parser('next', help='Move turn order forward by n steps.')
-    subcmd.add_argument('steps', nargs='?', type=int, default=1, help='Positive or negative steps of turns.')
-    subcmd = subcmds.add_parser('n', help='Move turn order forward by n steps.')
-    subcmd.add_argument('steps', nargs='?', type=int, default=1, help='Positive or negative steps of turns.')
-
-
-@register_parser
-def subs_n(subs, prefix):
-    """ Subcommand parsing for n (alias for turn --next) """
-    desc = f"""Shortcut for !turn --next
+    subcmds.add_parser('add', help='Add one or more combat characters.', parents=[turn_chars_parent('add')])
+    subcmds.add_parser('clear', help='Clear the combat.')
+    subcmds.add_parser('remove', help='Remove one or more combat characters by name.',
+                       parents=[turn_chars_parent('remove')])
+    subcmds.add_parser('update', help='Update the init rolls for one or more combat characters.',
+                       parents=[turn_chars_parent('update')])
+    subcmds.add_parser('next', help='Move turn order forward by n steps.', parents=[turn_steps_parent()])
+    subcmds.add_parser('n', help='Move turn order forward by n steps.', parents=[turn_steps_parent()])
+
+
+DESC_N = """Shortcut for !turn --next
 
 {prefix}n
         Show next turn player.
 {prefix}n num
         Show and advance next num players.
     """
+
+
+@register_parser()
+def subs_n(subs, prefix):
+    """ Subcommand parsing for n (alias for turn --next) """
+    desc = format_desc(DESC_N, prefix)
     sub = subs.add_parser(prefix + 'n', description=desc, formatter_class=RawHelp)
     sub.add_argument('steps', nargs='?', type=int, default=1, help='Move n steps forward or back in turns.')
     sub.set_defaults(cmd='Turn', subcmd='next', steps=1)
 
 
-#  @register_parser
+#  @register_parser()
 #  def subs_effect(subs, prefix):
     #  """ Subcommand parsing for effect """
     #  desc = """Track effects on characters in the turn order.
@@ -419,10 +690,7 @@ def subs_n(subs, prefix):
     #  sub.add_argument('-u', '--update', nargs='+', help='Update the effects turns for user.')
 
 
-@register_parser
-def subs_timer(subs, prefix):
-    """ Subcommand parsing for timer """
-    desc = f"""Set timers to remind you of things later!
+DESC_TIMER = """Set timers to remind you of things later!
 
     Default warnings if timer greater than vvalue:
         Warn at 60 minutes to finish.
@@ -440,6 +708,12 @@ def subs_timer(subs, prefix):
         Wait for 3:30 then mention user. Tea timer is set as the descritpion.
         User will be warned at 60 seconds and 30 seconds left.
     """
+
+
+@register_parser()
+def subs_timer(subs, prefix):
+    """ Subcommand parsing for timer """
+    desc = format_desc(DESC_TIMER, prefix)
     sub = subs.add_parser(prefix + 'timer', description=desc, formatter_class=RawHelp)
     sub.set_defaults(cmd='Timer')
     sub.add_argument('time', help='The time to wait.')
@@ -448,10 +722,7 @@ def subs_timer(subs, prefix):
     sub.add_argument('-d', '--description', nargs="+", help='The description of timer.')
 
 
-@register_parser
-def subs_timers(subs, prefix):
-    """ Subcommand parsing for timers """
-    desc = f"""Manage your timers.
+DESC_TIMERS = """Manage your timers.
 
 {prefix}timers
         Print all active timers you've started.
@@ -460,16 +731,19 @@ def subs_timers(subs, prefix):
 {prefix}timers --manage
         Interactively manage timers. Write 'done' to stop.
     """
+
+
+@register_parser()
+def subs_timers(subs, prefix):
+    """ Subcommand parsing for timers """
+    desc = format_desc(DESC_TIMERS, prefix)
     sub = subs.add_parser(prefix + 'timers', description=desc, formatter_class=RawHelp)
     sub.add_argument('-c', '--clear', action="store_true", help='Clear all timers.')
     sub.add_argument('-m', '--manage', action="store_true", help='Manage timers selectively.')
     sub.set_defaults(cmd='Timers')
 
 
-@register_parser
-def subs_pun(subs, prefix):
-    """ Subcommand parsing for puns """
-    desc = f"""Manage the puns!
+DESC_PUN = """Manage the puns!
 
 {prefix}pun
         Print a randomly selected pun.
@@ -478,13 +752,19 @@ def subs_pun(subs, prefix):
 {prefix}pun --manage
         Interactively manage the puns in the db, deleting as you like.
     """
+
+
+@register_parser()
+def subs_pun(subs, prefix):
+    """ Subcommand parsing for puns """
+    desc = format_desc(DESC_PUN, prefix)
     sub = subs.add_parser(prefix + 'pun', description=desc, formatter_class=RawHelp)
     sub.add_argument('-a', '--add', nargs='+', help='Add the provided pun.')
     sub.add_argument('-m', '--manage', action="store_true", help='Manage puns selectively.')
     sub.set_defaults(cmd='Pun')
 
 
-#  @register_parser
+#  @register_parser()
 #  def subs_yt(subs, prefix):
     #  """ Subcommand parsing for youtube search """
     #  desc = """Search youtube for songs to play.
@@ -499,10 +779,7 @@ def subs_pun(subs, prefix):
     #  sub.add_argument('terms', nargs='+', help='To search.')
 
 
-@register_parser
-def subs_googly(subs, prefix):
-    """ Subcommand parsing for googly!  """
-    desc = f"""Search youtube for songs to play.
+DESC_GOOGLY = """Search youtube for songs to play.
 
 {prefix}o.o +5
 {prefix}o.o +5
@@ -515,6 +792,12 @@ def subs_googly(subs, prefix):
 {prefix}o.o
         Show the overall status of googly eyes.
     """
+
+
+@register_parser(name='o.o')
+def subs_googly(subs, prefix):
+    """ Subcommand parsing for googly!  """
+    desc = format_desc(DESC_GOOGLY, prefix)
     sub = subs.add_parser(prefix + 'o.o', description=desc, formatter_class=RawHelp)
     sub.set_defaults(cmd='Googly')
     sub.add_argument('--set', type=int, help='Set the total googly eyes.')
@@ -522,10 +805,8 @@ def subs_googly(subs, prefix):
     sub.add_argument('offset', nargs="?", type=int, help='The offset to modify.')
 
 
-@register_parser
-def subs_reroll(subs, prefix):
-    """ Subcommand parsing for rerolls  """
-    desc = f"""Search youtube for songs to play.
+
+DESC_REROLL = """Search youtube for songs to play.
 
 {prefix}reroll
         Reroll the last roll you issued.
@@ -536,16 +817,19 @@ def subs_reroll(subs, prefix):
 {prefix}reroll --menu
         Browse the list of rolls you made and select one.
     """
+
+
+@register_parser()
+def subs_reroll(subs, prefix):
+    """ Subcommand parsing for rerolls  """
+    desc = format_desc(DESC_REROLL, prefix)
     sub = subs.add_parser(prefix + 'reroll', description=desc, formatter_class=RawHelp)
     sub.set_defaults(cmd='Reroll')
     sub.add_argument('--menu', action='store_true', help='Select reroll from reverse menu.')
     sub.add_argument('offset', nargs="?", type=int, default=-1, help='The offset to modify.')
 
 
-@register_parser
-def subs_movies(subs, prefix):
-    """ Subcommand parsing for movie rolling  """
-    desc = f"""Randomly select a movie from a saved list.
+DESC_MOVIES = """Randomly select a movie from a saved list.
 
 {prefix}movies roll
         Roll for a random movie from your own list. Shows result, removes movie.
@@ -562,6 +846,12 @@ def subs_movies(subs, prefix):
 {prefix}movies show -s
         Show the list of movies stored for current user. Uses format can be editted for update subcommand.
     """
+
+
+@register_parser()
+def subs_movies(subs, prefix):
+    """ Subcommand parsing for movie rolling  """
+    desc = format_desc(DESC_MOVIES, prefix)
     sub = subs.add_parser(prefix + 'movies', description=desc, formatter_class=RawHelp)
     sub.set_defaults(cmd='Movies', short=False)
     subsub = sub.add_subparsers(title='sub-subcommands',
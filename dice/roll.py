@@ -21,26 +21,37 @@ Logic regarding modifiers:
 import abc
 import asyncio
 import concurrent.futures
+import copy
 import functools
+import heapq
+import operator
+import random
 import re
 
+import numpy
 import numpy.random as rand
 
 import dice.exc
 from dice.util import ReprMixin
 
 PAD_LEN = 8
+BATCH_ROLL_MIN = 16
+BATCH_PREDICATE_MIN = 16
 IS_DIE = re.compile(r'(\d+)?d(\d+)', re.ASCII | re.IGNORECASE)
 IS_FATEDIE = re.compile(r'(\d+)?df', re.ASCII | re.IGNORECASE)
 IS_LITERAL = re.compile(r'([-+])|([0-9]+\b)', re.ASCII)
+IS_KEEPDROP = re.compile(r'(k|d)(h|l)?(\d+)', re.ASCII | re.IGNORECASE)
 IS_PREDICATE = re.compile(r'(>)?(<)?\[?(=?\d+)(,\d+\])?', re.ASCII)
 REROLL_MATCH = re.compile(r'(ro?\[\d+,\d+\])|(ro?[><=]\d+)|(ro?\d+)', re.ASCII | re.IGNORECASE)
+# Group names are the keys of MODIFIERS, alternatives mirror each should_parse in order
+MOD_DISPATCH = re.compile(r'(?P<compound>!!)|(?P<explode>!)|(?P<reroll>r)|(?P<keepdrop>[kd])'
+                          r'|(?P<successfail>f|>?<?\[?=?\d)|(?P<sort>s)', re.ASCII)
 LIMIT_DIE_NUMBER = 1000
 LIMIT_DIE_SIDES = 1000
 LIMIT_DICE_LIST_STR = 200
 LIMIT_ROLL_TIMES = 100
 POOL_ROLL_TIMEOUT = 30
-PARENS_MAP = {'(': 3, '{': 7, '[': 11, ')': -3, '}': -7, ']': -11}
+PARENS_PAIRS = (('(', ')'), ('{', '}'), ('[', ']'))
 DICE_WARN = """**Error**: {}
         {}
 Please see reference below and correct the roll.
@@ -74,6 +85,16 @@ All modifiers that support comparisons support all available comparisons.
 
 See `!roll --help` for more complete documentation.
 """
+DICE_WARN_PARTS = tuple(DICE_WARN.split('{}'))
+
+
+def dice_warn(msg, line):
+    """
+    Fill in DICE_WARN with the error msg and the offending line.
+    Equivalent to DICE_WARN.format(msg, line) without parsing the template each time.
+    """
+    pre, mid, post = DICE_WARN_PARTS
+    return pre + msg + mid + line + post
 
 
 class Comparison(ReprMixin, abc.ABC):
@@ -86,6 +107,7 @@ class Comparison(ReprMixin, abc.ABC):
         left: The left bound of the comparison (default used if not a range).
         right: The right bound of the comparison.
     """
+    __slots__ = ('left',)
     _repr_keys = ['left']
 
     def __init__(self, *, left=0):
@@ -101,11 +123,26 @@ class Comparison(ReprMixin, abc.ABC):
         """
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def mask(self, values):
+        """
+        Implement the comparison for a whole array of values at once.
+
+        Args:
+            values: A numpy array of integers.
+
+        Returns:
+            A numpy array of bools, True IFF the comparison is true for the value at that index.
+        """
+        raise NotImplementedError
+
 
 class CompareEqual(Comparison):  # pylint: disable=too-few-public-methods
     """
     Compare if an object is equal to a value.
     """
+    __slots__ = ()
+
     def __call__(self, other):
         """
         Check other == predetermined value (left).
@@ -115,11 +152,16 @@ class CompareEqual(Comparison):  # pylint: disable=too-few-public-methods
         """
         return int(other) == self.left
 
+    def mask(self, values):
+        return values == self.left
+
 
 class CompareLessEqual(Comparison):  # pylint: disable=too-few-public-methods
     """
     Compare if an object is less or equal to a value.
     """
+    __slots__ = ()
+
     def __call__(self, other):
         """
         Check other for <= predetermined value (left).
@@ -129,11 +171,16 @@ class CompareLessEqual(Comparison):  # pylint: disable=too-few-public-methods
         """
         return int(other) <= self.left
 
+    def mask(self, values):
+        return values <= self.left
+
 
 class CompareGreaterEqual(Comparison):  # pylint: disable=too-few-public-methods
     """
     Compare if an object is greater or equal to a value.
     """
+    __slots__ = ()
+
     def __call__(self, other):
         """
         Check other for >= predetermined value (left).
@@ -143,11 +190,15 @@ class CompareGreaterEqual(Comparison):  # pylint: disable=too-few-public-methods
         """
         return int(other) >= self.left
 
+    def mask(self, values):
+        return values >= self.left
+
 
 class CompareRange(Comparison):  # pylint: disable=too-few-public-methods
     """
     Compare if an object of integer value is in a range.
     """
+    __slots__ = ('right',)
     _repr_keys = ['left', 'right']
 
     def __init__(self, *, left=0, right=0):
@@ -163,7 +214,30 @@ class CompareRange(Comparison):  # pylint: disable=too-few-public-methods
         """
         return self.left <= int(other) <= self.right
 
+    def mask(self, values):
+        return (values >= self.left) & (values <= self.right)
+
+
+def predicate_hits(pred, die_list):
+    """
+    Evaluate a predicate against every die in die_list.
+    A Comparison checks BATCH_PREDICATE_MIN or more dice at once with a numpy mask,
+    other callables are called per die.
 
+    Args:
+        pred: The predicate, a Comparison or any callable taking a Die.
+        die_list: A list of Die.
+
+    Returns:
+        A list of bools, True IFF the predicate is true for the die at that index.
+    """
+    if len(die_list) < BATCH_PREDICATE_MIN or not isinstance(pred, Comparison):
+        return [pred(die) for die in die_list]
+
+    return pred.mask(numpy.array([d.value for d in die_list], dtype=int)).tolist()
+
+
+@functools.lru_cache(maxsize=1024)
 def parse_predicate(line, max_roll):
     """
     Return the next predicate based on line that will either:
@@ -173,6 +247,7 @@ def parse_predicate(line, max_roll):
         - Determine when dice value >= a_value, <= b_value ([4,6])
 
     The predicate will work on a Die object or else a simple int.
+    Results are cached, the returned predicates are shared and must not be modified.
 
     Args:
         line: A substring of a dice spec.
@@ -189,7 +264,7 @@ def parse_predicate(line, max_roll):
     """
     match = IS_PREDICATE.match(line)
     if not match:
-        raise ValueError(DICE_WARN.format("Unable to determine predicate.", line))
+        raise ValueError(dice_warn("Unable to determine predicate.", line))
 
     try:
         val = int(match.group(3))
@@ -199,17 +274,17 @@ def parse_predicate(line, max_roll):
     if match.group(4):
         right = int(match.group(4)[1:-1])
         if right < val or val < 1 or right > max_roll or (val == 1 and right == max_roll):
-            raise ValueError(DICE_WARN.format("Predicate range is invalid, check bounds.", line))
+            raise ValueError(dice_warn("Predicate range is invalid, check bounds.", line))
         comp = CompareRange(left=val, right=right)
 
     elif match.group(1):
         if val <= 1:
-            raise ValueError(DICE_WARN.format("Predicate will always be true (>=).", line))
+            raise ValueError(dice_warn("Predicate will always be true (>=).", line))
         comp = CompareGreaterEqual(left=val)
 
     elif match.group(2):
         if val >= max_roll:
-            raise ValueError(DICE_WARN.format("Predicate will always be true (<=).", line))
+            raise ValueError(dice_warn("Predicate will always be true (<=).", line))
         comp = CompareLessEqual(left=val)
 
     else:
@@ -233,7 +308,7 @@ def parse_dicelist(line):
     """
     match = IS_DIE.match(line)
     if not match:
-        raise ValueError(DICE_WARN.format("Invalid D20 dice roll.", line))
+        raise ValueError(dice_warn("Invalid D20 dice roll.", line))
 
     number = int(match.group(1)) if match.group(1) else 1
     sides = int(match.group(2))
@@ -244,7 +319,7 @@ def parse_dicelist(line):
     dlist.add_dice(number, sides)
 
     line, mods = parse_trailing_mods(line[match.end():], dlist.max_roll)
-    dlist.mods = sorted(mods)
+    dlist.mods = sorted(mods, key=lambda mod: mod.WEIGHT)
 
     return line, dlist
 
@@ -264,7 +339,7 @@ def parse_fate_dicelist(line):
     """
     match = IS_FATEDIE.match(line)
     if not match:
-        raise ValueError(DICE_WARN.format("Invalid FATE/FUDGE dice roll.", line))
+        raise ValueError(dice_warn("Invalid FATE/FUDGE dice roll.", line))
 
     number = int(match.group(1)) if match.group(1) else 1
     if number > LIMIT_DIE_NUMBER:
@@ -274,7 +349,7 @@ def parse_fate_dicelist(line):
     dlist.add_fatedice(number)
 
     line, mods = parse_trailing_mods(line[match.end():], dlist.max_roll)
-    dlist.mods = sorted(mods)
+    dlist.mods = sorted(mods, key=lambda mod: mod.WEIGHT)
 
     return line, dlist
 
@@ -296,16 +371,11 @@ def parse_trailing_mods(line, max_roll):
         if line[0] in [' ', '}', ',', '+', '-', '*', '/']:
             break
 
-        mod = None
-        for cls in (CompoundDice, ExplodeDice, RerollDice,
-                    KeepDrop, SuccessFail, SortDice):
-            if cls.should_parse(line):
-                line, mod = cls.parse(line, max_roll)
-                break
-
-        if not mod:
+        match = MOD_DISPATCH.match(line)
+        if not match:
             raise ValueError("Unable to parse dice spec, stuck at: " + line)
 
+        line, mod = MODIFIERS[match.lastgroup].parse(line, max_roll)
         mods += [mod]
 
     return line, mods
@@ -345,13 +415,8 @@ def check_parentheses(line):
     Returns:
         The line that was passed in.
     """
-    cnt = 0
-    for char in line:
-        if char in PARENS_MAP:
-            cnt += PARENS_MAP[char]
-
-    if cnt != 0:
-        raise ValueError(DICE_WARN.format("Unbalanced parentheses detected.", line))
+    if any(line.count(left) != line.count(right) for left, right in PARENS_PAIRS):
+        raise ValueError(dice_warn("Unbalanced parentheses detected.", line))
 
     return line
 
@@ -367,33 +432,21 @@ def parse_comments_from_back(line):
             line: Remainder of the line that is not a comment.
             comment: The part of the line that is a comment.
     """
-    token, comment = '', ''
+    token_end = len(line)
     word_boundary = False
 
-    pos = len(line) - 1
-    while pos != -1:
-        token = line[pos] + token
+    for pos in range(len(line) - 1, -1, -1):
+        if pos == 0 or (word_boundary and line[pos].isspace()):
+            token = line[pos:token_end].strip()
+            if IS_DIE.match(token) or IS_FATEDIE.match(token) or IS_LITERAL.match(token):
+                return line[:token_end], line[token_end:].strip()
 
-        if not line[1:] or (word_boundary and line[pos].isspace()):
-            is_comment, token_copy = True, token.strip()
-            for matcher in [IS_DIE, IS_FATEDIE, IS_LITERAL]:
-                if matcher.match(token_copy):
-                    is_comment = False
-                    break
-
-            if is_comment:
-                comment = token + comment
-            else:
-                line += token[1:]
-                break
-            token, word_boundary = '', False
+            token_end, word_boundary = pos, False
 
         elif not line[pos].isspace():
             word_boundary = True
 
-        pos, line = pos - 1, line[:-1]
-
-    return line, comment.strip()
+    return '', line.strip()
 
 
 def parse_dice_line(line, json=False):
@@ -431,10 +484,10 @@ def parse_dice_line(line, json=False):
                 pass
 
         if not obj:
-            raise ValueError(DICE_WARN.format("Failed to parse part of line.", spec))
+            raise ValueError(dice_warn("Failed to parse part of line.", spec))
 
     if not throw:
-        raise ValueError(DICE_WARN.format("No dice specification detected.", line))
+        raise ValueError(dice_warn("No dice specification detected.", line))
 
     return throw
 
@@ -448,6 +501,7 @@ class FlaggableMixin():
     Attributes:
         flags: A bit field that stores the flags.
     """
+    __slots__ = ('flags',)
     MASK = 0x3F
     KEEP = 1 << 0
     EXPLODE = 1 << 1
@@ -456,6 +510,10 @@ class FlaggableMixin():
     REROLL = 1 << 4
     FAIL = 1 << 5
     SUCCESS = 1 << 6
+    # Flags kept by set_drop, set_fail and set_success, anything outside MASK is cleared
+    DROP_KEEPS = ~KEEP & MASK
+    FAIL_KEEPS = ~SUCCESS & MASK
+    SUCCESS_KEEPS = ~FAIL & MASK
 
     def __init__(self):
         super().__init__()
@@ -495,8 +553,7 @@ class FlaggableMixin():
 
     def set_drop(self):
         """ Ensure this dice is dropped and no longer counted. """
-        self.flags = self.flags & (~Die.KEEP & Die.MASK)
-        self.flags = self.flags | Die.DROP
+        self.flags = (self.flags & Die.DROP_KEEPS) | Die.DROP
 
     def set_explode(self):
         """ The dice has been exploded. """
@@ -512,13 +569,42 @@ class FlaggableMixin():
 
     def set_fail(self):
         """ Set fail to display for this roll. """
-        self.flags = self.flags & (~Die.SUCCESS & Die.MASK)
-        self.flags = self.flags | Die.FAIL
+        self.flags = (self.flags & Die.FAIL_KEEPS) | Die.FAIL
 
     def set_success(self):
         """ Set success to display for this roll. """
-        self.flags = self.flags & (~Die.FAIL & Die.MASK)
-        self.flags = self.flags | Die.SUCCESS
+        self.flags = (self.flags & Die.SUCCESS_KEEPS) | Die.SUCCESS
+
+
+def make_fmt_string(flags):
+    """
+    Build the formatting string for a die with the given flags.
+
+    Returns:
+        A format string with one {} placeholder for the die's value.
+    """
+    fmt = "{}"
+
+    if flags & FlaggableMixin.REROLL:
+        fmt = fmt + "r"
+    if flags & FlaggableMixin.EXPLODE:
+        fmt = "__" + fmt + "__"
+    if flags & FlaggableMixin.DROP:
+        fmt = "~~" + fmt + "~~"
+    if flags & FlaggableMixin.SUCCESS:
+        fmt = "**" + fmt + "**"
+
+    return fmt
+
+
+# Only these flags change formatting, every combination is built once and indexed by flags
+FMT_FLAGS = FlaggableMixin.REROLL | FlaggableMixin.EXPLODE | FlaggableMixin.DROP | FlaggableMixin.SUCCESS
+FMT_STRINGS = tuple(make_fmt_string(flags) for flags in range(FMT_FLAGS + 1))
+# Modifiers skip dice carrying any of these flags
+EXPLODED_OR_REROLLED = FlaggableMixin.EXPLODE | FlaggableMixin.REROLL
+DROPPED_OR_REROLLED = FlaggableMixin.DROP | FlaggableMixin.REROLL
+DROPPED_REROLLED_OR_MARKED = DROPPED_OR_REROLLED | FlaggableMixin.FAIL | FlaggableMixin.SUCCESS
+DIE_VALUE = operator.attrgetter('value')
 
 
 @functools.total_ordering
@@ -535,6 +621,7 @@ class Die(ReprMixin, FlaggableMixin):
         _value: The value of the last roll, always [1, sides].
         flags: The flags tracking the Die's state.
     """
+    __slots__ = ('sides', '_value')
     _repr_keys = ['sides', 'value', 'flags']
 
     def __init__(self, *, sides=1, value=1, flags=1):
@@ -547,13 +634,13 @@ class Die(ReprMixin, FlaggableMixin):
         return self.fmt_string().format(self.value)
 
     def __hash__(self):
-        return hash(f'{self.sides}_{self.value}')
+        return hash((self.sides, self.value))
 
     def __eq__(self, other):
-        return issubclass(type(other), Die) and self.value == other.value
+        return isinstance(other, Die) and self.value == other.value
 
     def __lt__(self, other):
-        return issubclass(type(other), Die) and self.value < other.value
+        return isinstance(other, Die) and self.value < other.value
 
     def __int__(self):
         return self.value
@@ -579,24 +666,30 @@ class Die(ReprMixin, FlaggableMixin):
 
     def fmt_string(self):
         """ Return the correct formatting string given the die's current flags. """
-        fmt = "{}"
-
-        if self.is_rerolled():
-            fmt = fmt + "r"
-        if self.is_exploded():
-            fmt = "__" + fmt + "__"
-        if self.is_dropped():
-            fmt = "~~" + fmt + "~~"
-        if self.is_success():
-            fmt = "**" + fmt + "**"
-
-        return fmt
+        return FMT_STRINGS[self.flags & FMT_FLAGS]
 
     def roll(self):
-        """ Reroll the value of this dice. """
-        self._value = rand.randint(1, self.sides + 1)
+        """ Reroll the value of this dice, the new roll is kept with all other flags reset. """
+        self._value = random.randrange(1, self.sides + 1)
+        self.reset_flags()
         return self.value
 
+    @classmethod
+    def create_many(cls, number, **kwargs):
+        """
+        Create a number of dice, each equal to cls(**kwargs).
+        Only the first is constructed, the rest are shallow copies of it so
+        every slot set by __init__ is carried over, including those of subclasses.
+
+        Returns:
+            A list of the new dice.
+        """
+        if number < 1:
+            return []
+
+        first = cls(**kwargs)
+        return [first] + [copy.copy(first) for _ in range(number - 1)]
+
     def dupe(self):
         """ Create a duplicate dice based on this spec. """
         dupe = self.__class__(sides=self.sides)
@@ -620,6 +713,8 @@ class FateDie(Die):
     A Fate die is nothing more than a d3 where the value is mapped down -2.
     Representation is modified to be -, 0 or + due to the possible values.
     """
+    __slots__ = ()
+
     def __init__(self, **kwargs):
         kwargs['sides'] = 3
         if 'value' not in kwargs:
@@ -672,17 +767,14 @@ class DiceList(list):
         if not self:
             return ""
 
-        msg = str(self[0])
-        for prev_die, die in zip(self[:-1], self[1:]):
-            if issubclass(type(prev_die), FateDie):
-                msg += ' '
-            else:
-                msg += " + "
-            msg += str(die)
+        parts = [str(self[0])]
+        for prev_die, die in zip(self, self[1:]):
+            parts += [' ' if isinstance(prev_die, FateDie) else ' + ', str(die)]
+        msg = ''.join(parts)
 
         if len(msg) > LIMIT_DICE_LIST_STR:
-            parts = msg.split(' ')
-            msg = f"{' '.join(parts[:4])} ... {parts[-1]}"
+            words = msg.split(' ')
+            msg = f"{' '.join(words[:4])} ... {words[-1]}"
 
         return '(' + msg + ')'
 
@@ -703,7 +795,7 @@ class DiceList(list):
     @property
     def value(self):
         """ The value of this grouping is the sum of all non-dropped rolls. """
-        return sum(x.value for x in self if x.is_kept())
+        return sum(x.value for x in self if x.flags & Die.KEEP)
 
     @property
     def max_roll(self):
@@ -719,7 +811,7 @@ class DiceList(list):
             number: The number of Die to add.
             sides: The number of sides on the Die.
         """
-        self.extend([Die(sides=sides) for _ in range(0, number)])
+        self.extend(Die.create_many(number, sides=sides))
 
     def add_fatedice(self, number):
         """
@@ -729,15 +821,26 @@ class DiceList(list):
         Args:
             number: The number of FateDie to add.
         """
-        self.extend([FateDie() for _ in range(0, number)])
+        self.extend(FateDie.create_many(number))
 
     def roll(self):
         """
         Roll all the die in this list.
+        Die with the same number of sides are rolled in a single batch.
         """
+        by_sides = {}
         for die in self:
-            die.roll()
-            die.reset_flags()
+            by_sides.setdefault(die.sides, []).append(die)
+
+        for sides, group in by_sides.items():
+            if len(group) < BATCH_ROLL_MIN:
+                for die in group:
+                    die.roll()
+                continue
+
+            for die, value in zip(group, rand.randint(1, sides + 1, size=len(group)).tolist()):
+                die._value = value  # pylint: disable=protected-access
+                die.reset_flags()
 
     def apply_mods(self):
         """
@@ -793,7 +896,10 @@ class AThrow(list):
         value = 0
         next_coeff = 1
         for part in self:
-            if part == "-":
+            if isinstance(part, DiceList):
+                value = value + next_coeff * part.value
+
+            elif part == "-":
                 next_coeff *= -1
 
             elif part == "+":
@@ -807,7 +913,7 @@ class AThrow(list):
     def roll(self):
         """ Ensure all not fixed parts reroll. """
         for part in self:
-            if issubclass(type(part), DiceList):
+            if isinstance(part, DiceList):
                 part.roll()
                 part.apply_mods()
 
@@ -820,15 +926,15 @@ class AThrow(list):
         """
         msg, fcnt, scnt = "", 0, 0
         display_success = False
-        for dlist in [d for d in self if issubclass(type(d), DiceList)]:
+        for dlist in [d for d in self if isinstance(d, DiceList)]:
             for mod in dlist.mods:
                 if isinstance(mod, SuccessFail):
                     display_success = True
 
             for die in dlist:
-                if die.is_fail():
+                if die.flags & Die.FAIL:
                     fcnt += 1
-                elif die.is_success():
+                elif die.flags & Die.SUCCESS:
                     scnt += 1
 
         if display_success:
@@ -894,6 +1000,7 @@ class ModifyDice(abc.ABC):
     Class attribute WEIGHT is used in ordering modifiers before applying.
     Consider them like friend functions they modify the dice rolls once settled.
     """
+    __slots__ = ()
     WEIGHT = 0
 
     def __eq__(self, other):
@@ -959,6 +1066,7 @@ class ExplodeDice(ReprMixin, ModifyDice):
         pred: The predicate determining when to explode.
         penetrate: True if the die will penetrate on roll, else false.
     """
+    __slots__ = ('pred', 'penetrate')
     WEIGHT = 2
     _repr_keys = ['pred', 'penetrate']
 
@@ -986,16 +1094,18 @@ class ExplodeDice(ReprMixin, ModifyDice):
 
     def modify(self, dice_list):
         parts = []
-        for die in [d for d in dice_list if d.flags & (Die.EXPLODE | Die.REROLL) == 0]:
+        candidates = [d for d in dice_list if not d.flags & EXPLODED_OR_REROLLED]
+        for die, hit in zip(candidates, predicate_hits(self.pred, candidates)):
             parts += [die]
 
-            while self.pred(die):
+            while hit:
                 die = die.explode()
                 if self.penetrate:
                     die.set_penetrate()
                 parts += [die]
+                hit = self.pred(die)
 
-        for die in [d for d in parts if d.is_penetrated()]:
+        for die in (d for d in parts if d.is_penetrated()):
             die.value -= 1
 
         dice_list[:] = parts
@@ -1010,9 +1120,15 @@ class CompoundDice(ExplodeDice):
     Attributes:
         pred: The predicate determining when to explode.
         penetrate: Always false, inherited.
+        satisfiable: False when no possible roll satisfies the predicate, nothing will compound.
     """
+    __slots__ = ('satisfiable',)
     WEIGHT = 1
 
+    def __init__(self, *, pred, penetrate=False, satisfiable=True):
+        super().__init__(pred=pred, penetrate=penetrate)
+        self.satisfiable = satisfiable
+
     @staticmethod
     def should_parse(line):
         return line.startswith('!!')
@@ -1023,13 +1139,19 @@ class CompoundDice(ExplodeDice):
             raise ValueError("Compounding spec is invalid.")
 
         line, pred = parse_predicate(line[2:], max_roll)
+        # Covers the rolls of regular dice [1, max_roll] and FATE dice [-1, 1]
+        satisfiable = any(pred(x) for x in range(-1, max_roll + 1))
 
-        return line, CompoundDice(pred=pred)
+        return line, CompoundDice(pred=pred, satisfiable=satisfiable)
 
     def modify(self, dice_list):
-        for die in [d for d in dice_list if d.flags & (Die.EXPLODE | Die.REROLL) == 0]:
+        if not self.satisfiable:
+            return
+
+        pred = self.pred
+        for die in (d for d in dice_list if not d.flags & EXPLODED_OR_REROLLED):
             new_explode = die
-            while self.pred(new_explode):
+            while pred(new_explode):
                 new_explode = die.explode()
                 die.value += new_explode.value
 
@@ -1044,13 +1166,18 @@ class RerollDice(ReprMixin, ModifyDice):
     Attributes:
         reroll_always: The list of values that will trigger keep triggering reroll.
         reroll_once: The list of values that will trigger a single reroll.
+        always_set: Frozenset of reroll_always for fast membership tests.
+        once_set: Frozenset of reroll_once for fast membership tests.
     """
+    __slots__ = ('reroll_always', 'reroll_once', 'always_set', 'once_set')
     WEIGHT = 3
     _repr_keys = ['reroll_always', 'reroll_once']
 
     def __init__(self, *, reroll_always=None, reroll_once=None):
         self.reroll_always = reroll_always if reroll_always else []
         self.reroll_once = reroll_once if reroll_once else []
+        self.always_set = frozenset(self.reroll_always)
+        self.once_set = frozenset(self.reroll_once)
 
     @staticmethod
     def should_parse(line):
@@ -1062,23 +1189,27 @@ class RerollDice(ReprMixin, ModifyDice):
             raise ValueError("Reroll spec is invalid.")
 
         reroll_always, reroll_once = [], []
-        line_copy = line[:].lower()
-        for part in REROLL_MATCH.finditer(line_copy):
-            substr = line_copy[part.start():part.end()]
-            offset = 2 if substr[1] == 'o' else 1
-            _, pred = parse_predicate(substr[offset:], max_roll)
-
-            if substr[1] == 'o':
+        # Only the leading run of rerolls belongs to this dice list, later groups have their own
+        pos = 0
+        part = REROLL_MATCH.match(line)
+        while part:
+            substr = part.group()
+            once = substr[1] in 'oO'
+            _, pred = parse_predicate(substr[2 if once else 1:], max_roll)
+
+            if once:
                 reroll_once += [pred]
             else:
                 reroll_always += [pred]
-            line = line.replace(substr, '', 1)
+            pos = part.end()
+            part = REROLL_MATCH.match(line, pos)
+        line = line[pos:]
 
-        possible = list(range(1, max_roll + 1))
-        reroll_always = {x for x in possible if any(pred(x) for pred in reroll_always)}
-        reroll_once = {x for x in possible if any(pred(x) for pred in reroll_once)}
+        possible = frozenset(range(1, max_roll + 1))
+        reroll_always = set().union(*({x for x in possible if pred(x)} for pred in reroll_always))
+        reroll_once = set().union(*({x for x in possible if pred(x)} for pred in reroll_once))
 
-        if (not reroll_always and not reroll_once) or not set(possible) - reroll_always - reroll_once:
+        if (not reroll_always and not reroll_once) or not possible - reroll_always - reroll_once:
             raise ValueError("Reroll predicates are invalid. Combination Would always or never reroll!")
 
         if reroll_always & reroll_once:
@@ -1089,26 +1220,28 @@ class RerollDice(ReprMixin, ModifyDice):
 
     def modify(self, dice_list):
         new_list = []
+        once_set, always_set = self.once_set, self.always_set
         for die in dice_list:
-            new_list += [die]
-            if die.flags & (Die.EXPLODE | Die.REROLL):
+            new_list.append(die)
+            if die.flags & EXPLODED_OR_REROLLED:
                 continue
 
-            if die.value in self.reroll_once:
+            value = die.value
+            if value in once_set:
                 die.set_reroll()
                 die.set_drop()
                 die = die.dupe()
-                new_list += [die]
+                new_list.append(die)
                 continue
 
-            while die.value in self.reroll_always:
+            while value in always_set:
                 die.set_reroll()
                 die.set_drop()
                 die = die.dupe()
-                new_list += [die]
+                new_list.append(die)
+                value = die.value
 
-        dice_list.clear()
-        dice_list += new_list
+        dice_list[:] = new_list
 
 
 class KeepDrop(ReprMixin, ModifyDice):
@@ -1120,6 +1253,7 @@ class KeepDrop(ReprMixin, ModifyDice):
         high: When True, select from highest values. When False, select from lowest.
         num: The number to keep or drop.
     """
+    __slots__ = ('keep', 'high', 'num')
     WEIGHT = 4
     _repr_keys = ['keep', 'high', 'num']
 
@@ -1134,7 +1268,7 @@ class KeepDrop(ReprMixin, ModifyDice):
 
     @staticmethod
     def parse(line, _):
-        match = re.match(r'(k|d)(h|l)?(\d+)', line, re.ASCII | re.IGNORECASE)
+        match = IS_KEEPDROP.match(line)
         if not match:
             raise ValueError("Keep or Drop spec is invalid.")
 
@@ -1147,15 +1281,19 @@ class KeepDrop(ReprMixin, ModifyDice):
         return line[match.end():], KeepDrop(keep=keep, high=high, num=int(match.group(3)))
 
     def modify(self, dice_list):
-        parts = sorted([d for d in dice_list if d.flags & (Die.DROP | Die.REROLL) == 0])
-        if not self.keep:
-            parts = list(reversed(parts))
-
-        first, second = ['set_drop', 'NOP'] if self.high else ['NOP', 'set_drop']
-        for die in parts[:-self.num]:
-            getattr(die, first, lambda: True)()
-        for die in parts[-self.num:]:
-            getattr(die, second, lambda: True)()
+        candidates = [d for d in dice_list if not d.flags & DROPPED_OR_REROLLED]
+        # A num of 0 has always selected every die
+        num = self.num or len(candidates)
+        # Only num dice are selected, ties go to the later die for keep and the earlier for drop
+        if self.keep:
+            selected = heapq.nlargest(num, reversed(candidates), key=DIE_VALUE)
+        else:
+            selected = heapq.nsmallest(num, candidates, key=DIE_VALUE)
+        selected = {id(d) for d in selected}
+
+        for die in candidates:
+            if (id(die) in selected) != self.high:
+                die.set_drop()
 
 
 class SuccessFail(ModifyDice):
@@ -1167,6 +1305,7 @@ class SuccessFail(ModifyDice):
         pred: The predicate that determines when to set mark.
         mark: The method to invoke on the die to set state.
     """
+    __slots__ = ('pred', 'mark')
     WEIGHT = 5
     _repr_keys = ['pred', 'mark_success']
 
@@ -1192,9 +1331,11 @@ class SuccessFail(ModifyDice):
         return line, SuccessFail(pred=pred, mark_success=mark_success)
 
     def modify(self, dice_list):
-        for die in [d for d in dice_list if d.flags & (Die.DROP | Die.REROLL | Die.FAIL | Die.SUCCESS) == 0]:
-            if self.pred(die):
-                getattr(die, self.mark)()
+        pred, mark = self.pred, self.mark
+        candidates = [d for d in dice_list if not d.flags & DROPPED_REROLLED_OR_MARKED]
+        for die, hit in zip(candidates, predicate_hits(pred, candidates)):
+            if hit:
+                getattr(die, mark)()
 
 
 class SortDice(ModifyDice):
@@ -1204,6 +1345,7 @@ class SortDice(ModifyDice):
     Attributes:
         ascending: Sort will be in order from smallest to largest rolls.
     """
+    __slots__ = ('ascending',)
     WEIGHT = 6
     _repr_keys = ['ascending']
 
@@ -1232,11 +1374,20 @@ class SortDice(ModifyDice):
         return line, SortDice(ascending=ascending)
 
     def modify(self, dice_list):
-        ordered = sorted(dice_list)
+        # Descending sorts reverse the dice first so ties keep the order reversing an ascending sort gave
         if not self.ascending:
-            ordered = list(reversed(ordered))
-
-        dice_list[:] = ordered
+            dice_list.reverse()
+        dice_list.sort(reverse=not self.ascending)
+
+
+MODIFIERS = {
+    'compound': CompoundDice,
+    'explode': ExplodeDice,
+    'reroll': RerollDice,
+    'keepdrop': KeepDrop,
+    'successfail': SuccessFail,
+    'sort': SortDice,
+}
 
 
 async def make_rolls(spec):
@@ -61,6 +61,8 @@ class ModFormatter(logging.Formatter):
 
 class ReprMixin():
     """Mixin that generates my format repr for object storage."""
+    __slots__ = ()
+
     def __repr__(self):
         """
         Simple repr generating the following format:
@@ -452,6 +452,13 @@ async def test_cmd_timers_clear(f_bot):
         dice.actions.TIMERS.clear()
 
 
+def test_cmd_timer_bad_spec(f_bot):
+    msg = fake_msg_gears("!timer abc")
+
+    with pytest.raises(dice.exc.InvalidCommandArgs):
+        action_map(msg, f_bot)
+
+
 @pytest.mark.asyncio
 async def test_cmd_turn_no_turn_order(f_bot):
     msg = fake_msg("!turn next")
@@ -38,3 +38,177 @@ def test_make_parser():
     parser = dice.parse.make_parser('!')
     args = parser.parse_args('!math 1 + 1'.split())
     assert args.cmd == 'Math'
+    args = parser.parse_args('!m 1 + 1'.split())
+    assert args.cmd == 'Math'
+
+
+def test_make_parser_argv():
+    parser = dice.parse.make_parser('!', ['!r', '4d6'])
+    args = parser.parse_args(['!r', '4d6'])
+    assert args.cmd == 'Roll'
+    with pytest.raises(dice.exc.ArgumentParseError):
+        parser.parse_args('!math 1 + 1'.split())
+
+
+def test_aliases_for():
+    assert dice.parse.aliases_for('!', 'math') == ['!m']
+    assert dice.parse.aliases_for('!', 'roll') == ['!r']
+    assert dice.parse.aliases_for('!', 'help') == []
+
+
+def test_sniff_subcommand():
+    assert dice.parse.sniff_subcommand('!', ['!math', '1', '+', '1']) == 'math'
+    assert dice.parse.sniff_subcommand('!', ['!m', '1', '+', '1']) == 'math'
+    assert dice.parse.sniff_subcommand('!', ['!r', '4d6']) == 'roll'
+    assert dice.parse.sniff_subcommand('!', ['!o.o', '+5']) == 'o.o'
+    assert dice.parse.PARSERS['o.o'] is dice.parse.subs_googly
+    assert dice.parse.sniff_subcommand('!', ['!d5', '-n', '2', 'fireball']) == 'd5'
+    assert dice.parse.PARSERS['d5'] is dice.parse.subs_d5e
+    assert not dice.parse.sniff_subcommand('!', ['!not_cmd'])
+    assert not dice.parse.sniff_subcommand('!', ['!googly'])
+    assert not dice.parse.sniff_subcommand('!', ['!d5e', 'fireball'])
+    assert not dice.parse.sniff_subcommand('!', [])
+    assert not dice.parse.sniff_subcommand('!', ['foo', '!roll'])
+    assert not dice.parse.sniff_subcommand('!', None)
+
+
+def test_make_parser_first_token():
+    with pytest.raises(dice.exc.ArgumentParseError) as exc:
+        dice.parse.make_parser('!', ['foo', '!roll']).parse_args(['foo', '!roll'])
+    assert '!math' in str(exc.value)
+
+
+def test_make_parser_func_not_cmd():
+    with pytest.raises(dice.exc.ArgumentParseError) as exc:
+        dice.parse.make_parser('!', ['!googly']).parse_args(['!googly'])
+    assert "invalid choice: '!googly'" in str(exc.value)
+    for cmd in ['!help', '!math', '!m', '!roll', '!r', '!d5', '!o.o', '!status', '!movies']:
+        assert f"'{cmd}'" in str(exc.value)
+
+
+def test_make_parser_cached():
+    parser = dice.parse.make_parser('!')
+    assert parser is dice.parse.make_parser('!')
+    assert parser is not dice.parse.make_parser('!', ['!r', '4d6'])
+    assert parser is not dice.parse.build_parser.__wrapped__('!')
+
+
+def test_register_parser_duplicate():
+    def subs_help(subs, prefix):
+        pass
+
+    with pytest.raises(ValueError):
+        dice.parse.register_parser()(subs_help)
+    assert dice.parse.PARSERS['help'] is not subs_help
+    with pytest.raises(ValueError):
+        dice.parse.register_parser(name='status')(subs_help)
+    assert dice.parse.PARSERS['status'] is not subs_help
+
+    assert dice.parse.register_parser()(dice.parse.subs_math) is dice.parse.subs_math
+    assert dice.parse.PARSERS['math'] is dice.parse.subs_math
+
+
+def test_throw_parser_formatter():
+    parser = dice.parse.ThrowArggumentParser(prog='', description='A description.')
+    parser.add_argument('spec', nargs='+')
+    assert parser.format_help() == parser.format_help()
+    assert parser.format_usage() == parser.format_usage()
+
+    with pytest.raises(dice.exc.ArgumentHelpError) as exc:
+        parser.print_help()
+    assert str(exc.value) == 'A description.\n'
+    with pytest.raises(dice.exc.ArgumentHelpError) as exc:
+        parser.print_help()
+    assert str(exc.value) == 'A description.\n'
+
+
+@pytest.mark.parametrize("line", [
+    '!n',
+    '!n 3',
+    '!n -2',
+    '!r 4d6 + 2',
+    '!r 4d6 - 2 For Gordon',
+    '!roll 2d20kh1',
+    '!r',
+    '!m 1 + 2',
+    '!math 1 - 2, 3 * 4',
+    '!help',
+    '!status',
+    '!o.o',
+    '!poni pinkie pie',
+    '!pun',
+    '!reroll',
+    '!timers',
+])
+def test_fast_parse(line):
+    argv = line.split()
+    assert dice.parse.fast_parse('!', argv) == dice.parse.make_parser('!').parse_args(argv)
+
+
+@pytest.mark.parametrize("line", [
+    '!n next',
+    '!n 1 2',
+    '!n -h',
+    '!r -l',
+    '!r -s Name 4d6',
+    '!r 4d6 -2',
+    '!math',
+    '!math -h',
+    '!help me',
+    '!turn next',
+    '!o.o 2',
+    '!poni',
+    '!poni -h',
+    '!pun -a A pun',
+    '!reroll -2',
+    '!timers --clear',
+    'n 1',
+])
+def test_fast_parse_falls_back(line):
+    assert dice.parse.fast_parse('!', line.split()) is None
+
+
+def test_format_desc():
+    assert dice.parse.format_desc('Try {prefix}roll 4d6', '!') == 'Try !roll 4d6'
+
+    with pytest.raises(dice.exc.ArgumentHelpError) as exc:
+        dice.parse.make_parser('!').parse_args(['!math', '--help'])
+    assert '!math 1 + 2' in str(exc.value)
+
+
+def test_parse_args():
+    argv = '!timer 3:30 -d Tea timer'.split()
+    args = dice.parse.parse_args('!', argv)
+    assert args == dice.parse.make_parser('!').parse_args(argv)
+
+    args.description.append('modified')  # pylint: disable=no-member
+    args.offsets = ['1:00']
+    again = dice.parse.parse_args('!', argv)
+    assert again.description == ['Tea', 'timer']  # pylint: disable=no-member
+    assert again.offsets is None  # pylint: disable=no-member
+
+    with pytest.raises(dice.exc.ArgumentParseError):
+        dice.parse.parse_args('!', ['!not_cmd'])
+
+
+def test_static_parser():
+    assert dice.parse.PARSERS['status'] is dice.parse.subs_status
+    assert dice.parse.PARSERS['help'] is dice.parse.subs_help
+    assert dice.parse.subs_status.__name__ == 'subs_status'
+
+    args = dice.parse.make_parser('!').parse_args(['!status'])
+    assert args.cmd == 'Status'
+    with pytest.raises(dice.exc.ArgumentHelpError) as exc:
+        dice.parse.make_parser('!').parse_args(['!help', '--help'])
+    assert 'Show overall help message.' in str(exc.value)
+
+
+def test_throw_argument_parser_exit():
+    parser = dice.parse.ThrowArggumentParser(prog='')
+    with pytest.raises(dice.exc.ArgumentParseError) as exc:
+        parser.exit()
+    assert str(exc.value) == ''
+
+    with pytest.raises(dice.exc.ArgumentParseError) as exc:
+        parser.exit(2, 'Bad input.')
+    assert str(exc.value) == 'Bad input.'
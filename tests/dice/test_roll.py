@@ -5,6 +5,7 @@ Tests for dice rolling in dice.roll
 from __future__ import absolute_import, print_function
 import re
 
+import numpy
 import pytest
 
 import dice.exc
@@ -64,6 +65,14 @@ def test_regex_is_literal():
     assert not dice.roll.IS_LITERAL.match('4df')
 
 
+def test_regex_is_keepdrop():
+    assert dice.roll.IS_KEEPDROP.match('k2').groups() == ('k', None, '2')
+    assert dice.roll.IS_KEEPDROP.match('dl10').groups() == ('d', 'l', '10')
+    assert dice.roll.IS_KEEPDROP.match('KH3')
+    assert not dice.roll.IS_KEEPDROP.match('kh')
+    assert not dice.roll.IS_KEEPDROP.match('!4')
+
+
 def test_regex_reroll_match():
     assert dice.roll.REROLL_MATCH.match('r4')
     assert dice.roll.REROLL_MATCH.match('r=4')
@@ -74,6 +83,22 @@ def test_regex_reroll_match():
     assert dice.roll.REROLL_MATCH.findall('r4kl2!>5ro>4') == [('', '', 'r4'), ('', 'ro>4', '')]
 
 
+def test_regex_mod_dispatch():
+    assert dice.roll.MOD_DISPATCH.match('!!6').lastgroup == 'compound'
+    assert dice.roll.MOD_DISPATCH.match('!p>5').lastgroup == 'explode'
+    assert dice.roll.MOD_DISPATCH.match('ro[1,2]').lastgroup == 'reroll'
+    assert dice.roll.MOD_DISPATCH.match('dl2').lastgroup == 'keepdrop'
+    assert dice.roll.MOD_DISPATCH.match('f<2').lastgroup == 'successfail'
+    assert dice.roll.MOD_DISPATCH.match('[2,4]').lastgroup == 'successfail'
+    assert dice.roll.MOD_DISPATCH.match('sd').lastgroup == 'sort'
+    assert not dice.roll.MOD_DISPATCH.match('>a')
+    assert not dice.roll.MOD_DISPATCH.match('K2')
+
+
+def test_dice_warn():
+    assert dice.roll.dice_warn('Bad {roll}.', '4d{6}') == dice.roll.DICE_WARN.format('Bad {roll}.', '4d{6}')
+
+
 def test_check_parentheses():
     assert dice.roll.check_parentheses('()')
     assert dice.roll.check_parentheses('{}')
@@ -81,6 +106,8 @@ def test_check_parentheses():
 
     with pytest.raises(ValueError):
         dice.roll.check_parentheses('{]')
+    with pytest.raises(ValueError):
+        dice.roll.check_parentheses('(((((((}}}')
 
 
 def test_comparison__init__():
@@ -127,6 +154,26 @@ def test_comp_equal():
     assert not comp(6)
 
 
+@pytest.mark.parametrize("comp", [
+    CompareEqual(left=3),
+    CompareLessEqual(left=3),
+    CompareGreaterEqual(left=3),
+    CompareRange(left=2, right=4),
+])
+def test_comp_mask(comp):
+    values = list(range(1, 7))
+    assert comp.mask(numpy.array(values)).tolist() == [comp(x) for x in values]
+
+
+def test_predicate_hits():
+    die_list = [dice.roll.Die(sides=6, value=x % 6 + 1) for x in range(dice.roll.BATCH_PREDICATE_MIN + 4)]
+    expect = [d.value >= 5 for d in die_list]
+
+    assert dice.roll.predicate_hits(CompareGreaterEqual(left=5), die_list) == expect
+    assert dice.roll.predicate_hits(lambda x: x.value >= 5, die_list) == expect
+    assert dice.roll.predicate_hits(CompareGreaterEqual(left=5), die_list[:2]) == expect[:2]
+
+
 def test_parse_predicate_raises():
     with pytest.raises(ValueError):
         dice.roll.parse_predicate('>1', 6)
@@ -197,6 +244,12 @@ def test_parse_predicate_range():
     assert pred(dice.roll.Die(value=2))
 
 
+def test_parse_predicate_cached():
+    first = dice.roll.parse_predicate('[2,4]f<3', 6)
+    assert dice.roll.parse_predicate('[2,4]f<3', 6) is first
+    assert dice.roll.parse_predicate('[2,4]f<3', 5) is not first
+
+
 def test_parse_dicelist():
     nspec, dlist = dice.roll.parse_dicelist('4d20kh1')
     assert nspec == ''
@@ -383,6 +436,12 @@ def test_parse_dice_line_raises():
     with pytest.raises(ValueError):
         dice.roll.parse_dice_line('Just a comment.')
 
+    with pytest.raises(ValueError):
+        dice.roll.parse_dice_line('4d6r1 + 2d6R2')
+
+    with pytest.raises(ValueError):
+        dice.roll.parse_dice_line('4d6r1 + 2d6Ro3')
+
 
 def test_die__init__():
     die = dice.roll.Die(sides=6, value=1, flags=(dice.roll.Die.DROP | dice.roll.Die.EXPLODE))
@@ -418,7 +477,7 @@ def test_die__str__():
 
 def test_die__hash__():
     die = dice.roll.Die(sides=6, value=1)
-    assert hash(die) == hash("6_1")
+    assert hash(die) == hash((6, 1))
 
 
 def test_die__eq__():
@@ -494,10 +553,21 @@ def test_die_fmt_string_combinations():
     assert "**" in die.fmt_string()
 
 
+def test_make_fmt_string():
+    flags = Die.REROLL | Die.EXPLODE | Die.DROP | Die.SUCCESS
+    assert dice.roll.make_fmt_string(flags) == '**~~__{}r__~~**'
+    assert dice.roll.make_fmt_string(Die.KEEP | Die.FAIL) == '{}'
+    assert dice.roll.FMT_STRINGS[flags] == '**~~__{}r__~~**'
+
+
 def test_die_roll():
     die = dice.roll.Die(sides=6, value=1)
     assert die.roll() in range(1, 7)
 
+    die.set_drop()
+    die.roll()
+    assert die.flags == Die.KEEP
+
 
 def test_die_dupe():
     die = dice.roll.Die(sides=6, value=1)
@@ -753,6 +823,31 @@ def test_dicelist_add_die():
     assert issubclass(type(dlist[0]), dice.roll.Die)
 
 
+def test_die_create_many():
+    assert Die.create_many(0, sides=6) == []
+
+    dies = Die.create_many(3, sides=6, value=4)
+    assert [repr(die) for die in dies] == ['Die(sides=6, value=4, flags=1)'] * 3
+    assert len({id(die) for die in dies}) == 3
+
+    fates = FateDie.create_many(2)
+    assert [die.value for die in fates] == [0, 0]
+    assert all(isinstance(die, FateDie) for die in fates)
+
+
+def test_die_create_many_subclass():
+    class TaggedDie(Die):
+        __slots__ = ('tag',)
+
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.tag = 'tagged'
+
+    dies = TaggedDie.create_many(3, sides=6)
+    assert [die.tag for die in dies] == ['tagged'] * 3
+    assert [die.sides for die in dies] == [6] * 3
+
+
 def test_dicelist_add_fatedie():
     dlist = dice.roll.DiceList()
     dlist.add_fatedice(4)
@@ -768,6 +863,22 @@ def test_dicelist_roll_no_mod():
     assert str(dlist) != "(1 + 1 + 1 + 1)"
 
 
+def test_dicelist_roll_batched():
+    dlist = dice.roll.DiceList()
+    dlist.add_dice(50, 6)
+    dlist.add_fatedice(50)
+    dlist.add_dice(1, 20)
+    for die in dlist:
+        die.set_drop()
+    dlist.roll()
+
+    assert all(1 <= die.value <= 6 for die in dlist[:50])
+    assert all(-1 <= die.value <= 1 for die in dlist[50:100])
+    assert 1 <= dlist[-1].value <= 20
+    assert all(die.flags == Die.KEEP for die in dlist)
+    assert len({die.value for die in dlist[:50]}) > 1
+
+
 def test_dicelist_roll_mods():
     dlist = dice.roll.DiceList()
     dlist.add_dice(4, 6)
@@ -889,6 +1000,15 @@ def test_explode_dice_modify(f_dlist):
     assert len(f_dlist) >= 5
 
 
+def test_explode_modify_batch_func():
+    dlist = dice.roll.DiceList()
+    dlist += [dice.roll.Die(sides=6, value=x % 6 + 1) for x in range(dice.roll.BATCH_PREDICATE_MIN + 4)]
+    dice.roll.ExplodeDice(pred=lambda x: x.value >= 6).modify(dlist)
+
+    assert [d for d in dlist if d.is_exploded()]
+    assert len(dlist) > dice.roll.BATCH_PREDICATE_MIN + 4
+
+
 def test_penetrate_dice_parse():
     assert dice.roll.ExplodeDice.parse('!p>4', 6)[1].penetrate
 
@@ -945,6 +1065,36 @@ def test_compound_dice_modify(f_dlist):
     assert len(f_dlist) >= 4
 
 
+def test_compound_parse_satisfiable():
+    assert dice.roll.CompoundDice.parse('!!>4', 6)[1].satisfiable
+    assert dice.roll.CompoundDice.parse('!!=0', 3)[1].satisfiable
+    assert not dice.roll.CompoundDice.parse('!!=7', 6)[1].satisfiable
+
+
+def test_compound_modify_never(f_dlist):
+    values = [d.value for d in f_dlist]
+    mod = dice.roll.CompoundDice(pred=lambda x: True, satisfiable=False)
+    mod.modify(f_dlist)
+    assert [d.value for d in f_dlist] == values
+
+
+def test_compound_modify_no_hits(f_dlist):
+    values = [d.value for d in f_dlist]
+    mod = dice.roll.CompoundDice(pred=CompareEqual(left=0))
+    mod.modify(f_dlist)
+    assert [d.value for d in f_dlist] == values
+    assert not [d for d in f_dlist if d.is_exploded()]
+
+
+def test_compound_modify_fatedie():
+    _, mod = dice.roll.CompoundDice.parse('!!=0', 3)
+    dlist = DiceList()
+    dlist.add_fatedice(4)
+    mod.modify(dlist)
+    assert all(d.is_exploded() for d in dlist)
+    assert all(d.value in (-1, 1) for d in dlist)
+
+
 def test_reroll_dice_should_parse():
     assert dice.roll.RerollDice.should_parse('r>6')
     assert dice.roll.RerollDice.should_parse('ro<2')
@@ -983,6 +1133,17 @@ def test_reroll__both_dice_parse():
     assert line == '>2'
 
 
+def test_reroll_parse_leading_only():
+    line, mod = dice.roll.RerollDice.parse('r1 + 2d6r2', 6)
+    assert mod.reroll_always == [1]
+    assert line == ' + 2d6r2'
+
+    line, mod = dice.roll.RerollDice.parse('r1kh2ro3', 6)
+    assert mod.reroll_always == [1]
+    assert not mod.reroll_once
+    assert line == 'kh2ro3'
+
+
 def test_reroll_dice_parse_raises():
     with pytest.raises(ValueError):
         dice.roll.RerollDice.parse('s', 6)
@@ -1150,6 +1311,24 @@ def test_success_fail_modify(f_dlist):
     assert not f_dlist[3].is_success()
 
 
+def test_success_fail_modify_batch():
+    dlist = dice.roll.DiceList()
+    dlist += [dice.roll.Die(sides=6, value=x % 6 + 1) for x in range(dice.roll.BATCH_PREDICATE_MIN * 2)]
+    dlist[0].set_drop()
+    dice.roll.SuccessFail(pred=CompareGreaterEqual(left=5)).modify(dlist)
+
+    assert [bool(d.is_success()) for d in dlist[1:]] == [d.value >= 5 for d in dlist[1:]]
+    assert not dlist[0].is_success()
+
+
+def test_success_modify_batch_func():
+    dlist = dice.roll.DiceList()
+    dlist += [dice.roll.Die(sides=6, value=x % 6 + 1) for x in range(dice.roll.BATCH_PREDICATE_MIN + 4)]
+    dice.roll.SuccessFail(pred=lambda x: x.value >= 4).modify(dlist)
+
+    assert [bool(d.is_success()) for d in dlist] == [d.value >= 4 for d in dlist]
+
+
 def test_sort_dice_should_parse():
     assert dice.roll.SortDice.should_parse('sd')
     assert not dice.roll.SortDice.should_parse('!!>6')